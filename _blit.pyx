@@ -0,0 +1,38 @@
+# cython: boundscheck=False, wraparound=False, language_level=3
+"""
+Glyph Blit Extension
+Optional compiled blit loop for the dual screen text windows.
+Build in place with: cythonize -i _blit.pyx
+"""
+
+from libc.stdint cimport uint8_t, int64_t
+
+def blit_column(uint8_t[:, :] area, const int64_t[::1] ys, const int64_t[::1] xs,
+                list glyph_ids, get_glyph):
+    """Blend cached white glyphs at (ys, xs), clipped to the text area"""
+    cdef Py_ssize_t area_height = area.shape[0]
+    cdef Py_ssize_t area_width = area.shape[1]
+    cdef Py_ssize_t k, i, j, x0, y0, x1, y1, start_x, start_y
+    cdef const uint8_t[:, ::1] bitmap
+    cdef unsigned int mask, blended
+
+    for k in range(ys.shape[0]):
+        x_offset, y_offset, glyph = get_glyph(glyph_ids[k])
+        if glyph is None:
+            continue
+        bitmap = glyph
+
+        x0 = xs[k] + <Py_ssize_t>x_offset
+        y0 = ys[k] + <Py_ssize_t>y_offset
+        x1 = min(x0 + bitmap.shape[1], area_width)
+        y1 = min(y0 + bitmap.shape[0], area_height)
+        start_x = max(x0, 0)
+        start_y = max(y0, 0)
+
+        # Blend rather than copy so overlapping glyphs don't erase each other,
+        # rounding exactly as PIL composites a fill through a mask
+        for i in range(start_y, y1):
+            for j in range(start_x, x1):
+                mask = bitmap[i - y0, j - x0]
+                blended = area[i, j] * (255 - mask) + mask * 255 + 128
+                area[i, j] = <uint8_t>((blended + (blended >> 8)) >> 8)
@@ -42,6 +42,26 @@ def parse_arguments():
                        action="store_true",
                        help="Enable dual screen display (camera + text)")
     
+    parser.add_argument("--no-compile", 
+                       action="store_true",
+                       help="Disable torch.compile and run the model in eager mode")
+    
+    parser.add_argument("--quant", 
+                       choices=["none", "int8", "nf4"],
+                       default="none",
+                       help="Weight quantization: bitsandbytes on GPU, "
+                            "torch dynamic int8 on CPU (default: none)")
+    
+    parser.add_argument("--beams", 
+                       type=int, 
+                       default=1,
+                       help="Beam search width, 1 = greedy decoding (default: 1)")
+    
+    parser.add_argument("--max-tokens", 
+                       type=int, 
+                       default=20,
+                       help="Maximum new tokens per caption (default: 20)")
+    
     return parser.parse_args()
 
 def select_model(args):
@@ -64,7 +84,11 @@ def main():
         camera_index=args.camera,
         show_camera=args.show_camera,
         interval=args.interval,
-        dual_screen=args.dual_screen
+        dual_screen=args.dual_screen,
+        compile_model=not args.no_compile,
+        quant=args.quant,
+        num_beams=args.beams,
+        max_new_tokens=args.max_tokens
     )
     
     # Show status if requested
@@ -75,6 +99,7 @@ def main():
         
         print(f"Model: {status['model_info']['model_name']}")
         print(f"Device: {status['model_info']['device']}")
+        print(f"Quantization: {status['model_info']['quant']}")
         print(f"Model Loaded: {status['model_info']['loaded']}")
         print(f"Camera Index: {status['camera_info'].get('camera_index', 'N/A')}")
         print(f"Show Camera: {status['settings']['show_camera']}")
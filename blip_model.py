@@ -4,19 +4,84 @@ BLIP Model Management Module
 Handles BLIP model loading, processing, and caption generation.
 """
 
+import contextlib
+import platform
+import numpy as np
 import torch
-from transformers import BlipProcessor, BlipForConditionalGeneration
-from PIL import Image
+from transformers import BlipProcessor, BlipForConditionalGeneration, BitsAndBytesConfig
+from transformers.modeling_outputs import BaseModelOutputWithPooling
 import os
 
+try:
+    from torch.nn.attention import sdpa_kernel, SDPBackend
+except ImportError:  # torch < 2.3
+    sdpa_kernel = None
+
+# Ahead-of-time compiled vision encoders are cached here across runs
+AOT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ksana-vision")
+
+class VisionEncoderExport(torch.nn.Module):
+    """Vision encoder wrapper with plain tensor outputs for torch.export"""
+    
+    def __init__(self, vision_model):
+        super().__init__()
+        self.vision_model = vision_model
+    
+    def forward(self, pixel_values):
+        outputs = self.vision_model(pixel_values=pixel_values, return_dict=True)
+        return outputs.last_hidden_state, outputs.pooler_output
+
 class BLIPModelManager:
     """Manages BLIP model loading and caption generation"""
     
-    def __init__(self, model_name="Salesforce/blip-image-captioning-base"):
+    QUANT_MODES = ("none", "int8", "nf4")
+    
+    def __init__(self, model_name="Salesforce/blip-image-captioning-base", compile_model=True,
+                 quant="none", num_beams=1, max_new_tokens=20):
+        if quant not in self.QUANT_MODES:
+            raise ValueError(f"Unknown quantization mode: {quant}")
+        
         self.model_name = model_name
+        self.compile_model = compile_model
+        self.quant = quant
+        self.num_beams = num_beams
+        self.max_new_tokens = max_new_tokens
         self.device = self._get_device()
         self.processor = None
         self.model = None
+        self.compiled = False
+        self.aot_vision = False
+        self.cuda_graph = False
+        
+        # Restrict attention to fused SDPA kernels on CUDA (disabled if unsupported)
+        self._fused_sdpa = self.device == "cuda"
+        
+        # Keep intermediate activations in fp16 - MPS autocast needs a recent torch
+        self._autocast_device = None
+        if self.device == "cuda":
+            self._autocast_device = "cuda"
+        elif (self.device == "mps" and hasattr(torch.amp, "is_autocast_available") and 
+                torch.amp.is_autocast_available("mps")):
+            self._autocast_device = "mps"
+        
+        # Preprocessing state (filled in by load_model)
+        self._input_size = None
+        self._pixel_dtype = None
+        self._mean = None
+        self._std = None
+        self._pinned = None
+        self._resized = None
+        
+        # Generation settings - greedy decoding by default; use_cache stays explicit
+        # so the KV cache (and compiled shapes) never change between calls
+        self.generate_kwargs = {
+            "max_new_tokens": max_new_tokens,
+            "num_beams": num_beams,
+            "do_sample": False,
+            "use_cache": True
+        }
+        if num_beams > 1:
+            self.generate_kwargs["early_stopping"] = True
         
     def _get_device(self):
         """Determine the best available device"""
@@ -32,6 +97,13 @@ class BLIPModelManager:
         print(f"🔄 Loading {self.model_name}...")
         print(f"📱 Using device: {self.device}")
         
+        # Free CUDA speedups: TF32 tensor cores and cuDNN autotuning
+        if self.device == "cuda":
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+            torch.backends.cudnn.benchmark = True
+            torch.set_float32_matmul_precision("high")
+        
         try:
             # Load processor with fast tokenizer
             self.processor = BlipProcessor.from_pretrained(
@@ -40,44 +112,341 @@ class BLIPModelManager:
             )
             
             # Load model with appropriate settings and use safetensors
+            dtype = torch.float16 if self.device in ["mps", "cuda"] else torch.float32
+            model_kwargs = {
+                "device_map": self.device,
+                "use_safetensors": True
+            }
+            
+            # Quantized weights replace the manual dtype; layernorms listed in
+            # _keep_in_fp32_modules stay in full precision
+            quant_config = self._get_quant_config(dtype)
+            if quant_config is not None:
+                print(f"🗜️  Quantizing weights: {self.quant}")
+                model_kwargs["quantization_config"] = quant_config
+            else:
+                model_kwargs["dtype"] = dtype
+            
             self.model = BlipForConditionalGeneration.from_pretrained(
                 self.model_name,
-                device_map=self.device,
-                dtype=torch.float16 if self.device in ["mps", "cuda"] else torch.float32,
-                use_safetensors=True
+                **model_kwargs
             )
             
             print("✅ Model loaded successfully!")
+            
+            # bitsandbytes int8 kernels need CUDA - on CPU quantize Linear layers natively
+            if self.quant == "int8" and self.device == "cpu":
+                self._quantize_dynamic()
+            
+            # Precompute preprocessing constants and the reusable input buffer
+            self._prepare_preprocessing()
+            
+            # Compile vision encoder and text decoder for faster inference.
+            # The vision encoder always sees one input shape, so it is built
+            # ahead of time where AOTInductor is available.
+            if self.compile_model:
+                if self.quant == "none" and self.device in ["cuda", "cpu"]:
+                    self.aot_vision = self._load_aot_vision_encoder()
+                self._compile_model()
+            
+            # torch.compile's reduce-overhead mode already records CUDA graphs;
+            # otherwise capture the fixed-shape vision encoder by hand
+            if self.device == "cuda" and not (self.compiled or self.aot_vision):
+                self.cuda_graph = self._capture_vision_graph()
+            
             return True
             
         except Exception as e:
             print(f"❌ Error loading model: {e}")
             return False
     
+    def _prepare_preprocessing(self):
+        """Precompute normalization tensors and allocate the host input buffer"""
+        image_processor = self.processor.image_processor
+        size = image_processor.size
+        self._input_size = (size.get("height", 384), size.get("width", 384))
+        self._pixel_dtype = self.model.dtype
+        
+        # Fold the 1/255 rescale into mean/std so uint8 pixels normalize in one step
+        scale = 1.0 / image_processor.rescale_factor
+        self._mean = torch.tensor(
+            image_processor.image_mean, dtype=torch.float32, device=self.device
+        ).view(1, 3, 1, 1).mul(scale).to(self._pixel_dtype)
+        self._std = torch.tensor(
+            image_processor.image_std, dtype=torch.float32, device=self.device
+        ).view(1, 3, 1, 1).mul(scale).to(self._pixel_dtype)
+        
+        # Reused resize target, plus pinned memory for asynchronous
+        # host-to-device copies (CUDA only)
+        height, width = self._input_size
+        self._resized = np.empty((height, width, 3), dtype=np.uint8)
+        self._pinned = torch.empty(
+            (1, 3, height, width), 
+            dtype=torch.uint8, 
+            pin_memory=self.device == "cuda"
+        )
+    
+    def _preprocess_frame(self, frame, bgr=True):
+        """Convert an HWC uint8 frame into normalized pixel values on device"""
+        height, width = self._input_size
+        
+        # Downsample to the model resolution first (SIMD area filter) so the
+        # copies touch fewer bytes
+        resized = cv2.resize(
+            frame, (width, height), 
+            dst=self._resized, 
+            interpolation=cv2.INTER_AREA
+        )
+        
+        # HWC uint8 -> NCHW, staged through the reusable host buffer. BGR frames
+        # are read channel-reversed during the copy instead of a separate cvtColor pass.
+        hwc = torch.from_numpy(resized)
+        channels = (2, 1, 0) if bgr else (0, 1, 2)
+        for dst, src in enumerate(channels):
+            self._pinned[0, dst].copy_(hwc[:, :, src])
+        pixels = self._pinned.to(self.device, non_blocking=True)
+        
+        return (pixels.to(self._pixel_dtype) - self._mean) / self._std
+    
+    def _get_quant_config(self, compute_dtype):
+        """Build the bitsandbytes quantization config for the selected mode"""
+        if self.quant == "int8" and self.device != "cpu":
+            return BitsAndBytesConfig(
+                load_in_8bit=True, 
+                llm_int8_threshold=0.0
+            )
+        elif self.quant == "nf4":
+            return BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_quant_type="nf4",
+                bnb_4bit_compute_dtype=compute_dtype
+            )
+        else:
+            return None
+    
+    def _quantize_dynamic(self):
+        """Swap nn.Linear layers for dynamic int8 versions (CPU only)"""
+        print("🗜️  Quantizing Linear layers to int8 (dynamic)")
+        
+        # fbgemm uses x86 VNNI int8 instructions, qnnpack targets ARM
+        engine = "qnnpack" if platform.machine().lower() in ("arm64", "aarch64") else "fbgemm"
+        if engine in torch.backends.quantized.supported_engines:
+            torch.backends.quantized.engine = engine
+        
+        # Only Linear layers are replaced - embeddings and layernorms stay fp32
+        self.model = torch.ao.quantization.quantize_dynamic(
+            self.model, 
+            {torch.nn.Linear}, 
+            dtype=torch.qint8,
+            inplace=True
+        )
+    
+    def _load_aot_vision_encoder(self):
+        """Swap in an AOTInductor build of the vision encoder for the fixed input shape"""
+        height, width = self._input_size
+        input_shape = (1, 3, height, width)
+        model_slug = self.model_name.replace("/", "--")
+        dtype_name = str(self._pixel_dtype).replace("torch.", "")
+        package_name = (
+            f"{model_slug}_vit_{height}x{width}_{self.device}_{dtype_name}"
+            f"_torch{torch.__version__}.pt2"
+        )
+        package_path = os.path.join(AOT_CACHE_DIR, package_name)
+        
+        try:
+            if not os.path.exists(package_path):
+                print("⚙️  Exporting vision encoder with AOTInductor (one-time)...")
+                example = (torch.zeros(input_shape, dtype=self._pixel_dtype, device=self.device),)
+                with torch.no_grad():
+                    exported = torch.export.export(
+                        VisionEncoderExport(self.model.vision_model).eval(), 
+                        example
+                    )
+                os.makedirs(AOT_CACHE_DIR, exist_ok=True)
+                torch._inductor.aoti_compile_and_package(exported, package_path=package_path)
+            
+            compiled_encoder = torch._inductor.aoti_load_package(package_path)
+            
+        except Exception as e:
+            print(f"⚠️  AOTInductor export unavailable, using default vision encoder: {e}")
+            return False
+        
+        eager_forward = self.model.vision_model.forward
+        
+        def forward(pixel_values=None, output_attentions=None, output_hidden_states=None,
+                    return_dict=None, interpolate_pos_encoding=False):
+            # Anything other than the exported shape and outputs runs eagerly
+            if (pixel_values is None or tuple(pixel_values.shape) != input_shape or 
+                    output_attentions or output_hidden_states or 
+                    return_dict is False or interpolate_pos_encoding):
+                return eager_forward(
+                    pixel_values=pixel_values,
+                    output_attentions=output_attentions,
+                    output_hidden_states=output_hidden_states,
+                    return_dict=return_dict,
+                    interpolate_pos_encoding=interpolate_pos_encoding
+                )
+            
+            last_hidden_state, pooler_output = compiled_encoder(pixel_values)
+            return BaseModelOutputWithPooling(
+                last_hidden_state=last_hidden_state, 
+                pooler_output=pooler_output
+            )
+        
+        self.model.vision_model.forward = forward
+        print("✅ Vision encoder loaded from AOTInductor package")
+        return True
+    
+    def _capture_vision_graph(self):
+        """Record the vision encoder as a CUDA graph and replay it for each frame"""
+        height, width = self._input_size
+        input_shape = (1, 3, height, width)
+        eager_forward = self.model.vision_model.forward
+        
+        try:
+            with torch.inference_mode(), self._autocast_context(), self._sdpa_context():
+                static_input = torch.zeros(input_shape, dtype=self._pixel_dtype, device=self.device)
+                
+                # Warm up on a side stream so lazy initialization isn't captured
+                side_stream = torch.cuda.Stream()
+                side_stream.wait_stream(torch.cuda.current_stream())
+                with torch.cuda.stream(side_stream):
+                    for _ in range(3):
+                        eager_forward(pixel_values=static_input, return_dict=True)
+                torch.cuda.current_stream().wait_stream(side_stream)
+                
+                graph = torch.cuda.CUDAGraph()
+                with torch.cuda.graph(graph):
+                    static_output = eager_forward(pixel_values=static_input, return_dict=True)
+            
+        except Exception as e:
+            print(f"⚠️  CUDA graph capture failed, using default vision encoder: {e}")
+            return False
+        
+        def forward(pixel_values=None, output_attentions=None, output_hidden_states=None,
+                    return_dict=None, interpolate_pos_encoding=False):
+            # Anything other than the captured shape and outputs runs eagerly
+            if (pixel_values is None or tuple(pixel_values.shape) != input_shape or 
+                    output_attentions or output_hidden_states or 
+                    return_dict is False or interpolate_pos_encoding):
+                return eager_forward(
+                    pixel_values=pixel_values,
+                    output_attentions=output_attentions,
+                    output_hidden_states=output_hidden_states,
+                    return_dict=return_dict,
+                    interpolate_pos_encoding=interpolate_pos_encoding
+                )
+            
+            # Outputs live in the graph's static buffers and are overwritten on the next replay
+            static_input.copy_(pixel_values, non_blocking=True)
+            graph.replay()
+            return BaseModelOutputWithPooling(
+                last_hidden_state=static_output.last_hidden_state, 
+                pooler_output=static_output.pooler_output
+            )
+        
+        self.model.vision_model.forward = forward
+        print("✅ Vision encoder captured as a CUDA graph")
+        return True
+    
+    def _compile_model(self):
+        """Wrap vision encoder and text decoder with torch.compile, falling back to eager"""
+        print("⚙️  Compiling model with torch.compile (first run may take a while)...")
+        
+        vision_forward = self.model.vision_model.forward
+        decoder_forward = self.model.text_decoder.forward
+        
+        try:
+            # Allow enough recompiles for the growing decoder sequence length
+            torch._dynamo.config.cache_size_limit = 64
+            
+            # An AOTInductor vision encoder is already compiled
+            if not self.aot_vision:
+                self.model.vision_model.forward = torch.compile(
+                    vision_forward, 
+                    mode="reduce-overhead", 
+                    fullgraph=False
+                )
+            self.model.text_decoder.forward = torch.compile(
+                decoder_forward, 
+                mode="reduce-overhead", 
+                fullgraph=False
+            )
+            
+            # Warm up once so the first real frame doesn't pay the compile cost
+            self._warmup()
+            
+            self.compiled = True
+            print("✅ Model compiled successfully!")
+            
+        except Exception as e:
+            # Unsupported backend - restore eager forwards
+            self.model.vision_model.forward = vision_forward
+            self.model.text_decoder.forward = decoder_forward
+            print(f"⚠️  torch.compile unavailable, using eager mode: {e}")
+    
+    def _warmup(self):
+        """Run a dummy caption generation to trigger compilation"""
+        height, width = self._input_size
+        dummy = torch.zeros(
+            1, 3, height, width,
+            dtype=self._pixel_dtype, 
+            device=self.device
+        )
+        
+        with torch.inference_mode(), self._autocast_context():
+            self._generate(dummy)
+    
+    def _autocast_context(self):
+        """fp16 autocast on CUDA (and MPS where supported), no-op elsewhere"""
+        if self._autocast_device is None:
+            return contextlib.nullcontext()
+        return torch.autocast(device_type=self._autocast_device, dtype=torch.float16)
+    
+    def _sdpa_context(self):
+        """Limit scaled_dot_product_attention to flash / memory-efficient kernels"""
+        if not self._fused_sdpa:
+            return contextlib.nullcontext()
+        
+        if sdpa_kernel is not None:
+            return sdpa_kernel([SDPBackend.FLASH_ATTENTION, SDPBackend.EFFICIENT_ATTENTION])
+        
+        return torch.backends.cuda.sdp_kernel(
+            enable_flash=True, 
+            enable_mem_efficient=True, 
+            enable_math=False
+        )
+    
+    def _generate(self, pixel_values):
+        """Run model.generate, falling back to the math attention kernel if needed"""
+        try:
+            with self._sdpa_context():
+                return self.model.generate(pixel_values=pixel_values, **self.generate_kwargs)
+        except RuntimeError as e:
+            if not self._fused_sdpa:
+                raise
+            
+            # No fused kernel for this shape/dtype - allow all kernels from now on
+            print(f"⚠️  Fused attention unavailable, using default kernels: {e}")
+            self._fused_sdpa = False
+            return self.model.generate(pixel_values=pixel_values, **self.generate_kwargs)
+    
     def generate_caption(self, image):
         """Generate caption for the given image"""
         if not self.processor or not self.model:
             return "Error: Model not loaded"
         
         try:
-            # Ensure image is PIL Image
-            if hasattr(image, 'shape'):  # OpenCV frame
-                image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(image_rgb)
-            else:
-                pil_image = image
-            
-            # Process with BLIP
-            inputs = self.processor(images=pil_image, return_tensors="pt").to(self.device)
-            
-            # Generate caption
-            with torch.no_grad():
-                outputs = self.model.generate(
-                    **inputs, 
-                    max_length=50, 
-                    num_beams=5,
-                    do_sample=False
-                )
+            # inference_mode skips autograd version tracking entirely
+            with torch.inference_mode(), self._autocast_context():
+                if hasattr(image, 'shape'):  # OpenCV frame
+                    pixel_values = self._preprocess_frame(image)
+                else:
+                    # PIL image - already RGB
+                    pixel_values = self._preprocess_frame(np.asarray(image.convert("RGB")), bgr=False)
+                
+                # Generate caption
+                outputs = self._generate(pixel_values)
             
             caption = self.processor.decode(outputs[0], skip_special_tokens=True)
             return caption
@@ -90,7 +459,13 @@ class BLIPModelManager:
         return {
             "model_name": self.model_name,
             "device": self.device,
-            "loaded": self.model is not None
+            "quant": self.quant,
+            "num_beams": self.num_beams,
+            "max_new_tokens": self.max_new_tokens,
+            "loaded": self.model is not None,
+            "compiled": self.compiled,
+            "aot_vision": self.aot_vision,
+            "cuda_graph": self.cuda_graph
         }
 
 # Import cv2 here to avoid circular imports
@@ -11,6 +11,10 @@ from typing import Optional, Tuple
 class CameraManager:
     """Manages camera operations and display"""
     
+    # Stale-frame draining: a grab that returns faster than this was already queued
+    MAX_DRAIN_GRABS = 4
+    QUEUED_GRAB_TIME = 0.005  # seconds
+    
     def __init__(self, camera_index=0, show_window=False):
         self.camera_index = camera_index
         self.show_window = show_window
@@ -35,6 +39,11 @@ class CameraManager:
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
         self.cap.set(cv2.CAP_PROP_FPS, 30)
         
+        # Compressed MJPG avoids saturating USB bandwidth with raw YUYV,
+        # and a single-frame buffer keeps captured frames fresh
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        
         print("✅ Camera initialized successfully!")
         return True
     
@@ -46,13 +55,31 @@ class CameraManager:
         ret, frame = self.cap.read()
         return ret, frame
     
+    def read_latest_frame(self) -> Tuple[bool, Optional[cv2.Mat]]:
+        """Read the most recent frame, dropping any frames queued by the driver"""
+        if not self.cap:
+            return False, None
+        
+        # Queued frames are grabbed immediately; stop once a grab has to wait
+        # for the camera, which means the buffer was drained to a fresh frame
+        for _ in range(self.MAX_DRAIN_GRABS):
+            start = time.perf_counter()
+            if not self.cap.grab():
+                return False, None
+            if time.perf_counter() - start > self.QUEUED_GRAB_TIME:
+                break
+        
+        return self.cap.retrieve()
+    
     def display_frame(self, frame, caption: str = ""):
         """Display frame with optional caption overlay"""
         if not self.show_window:
             return
         
-        # Create display frame with caption
-        display_frame = frame.copy()
+        # Draw on the frame itself and put the caption rows back after imshow,
+        # instead of copying the whole frame
+        display_frame = frame
+        saved_rows = display_frame[:45].copy() if caption else None
         
         if caption:
             self.current_caption = caption
@@ -68,13 +95,17 @@ class CameraManager:
             )
         
         cv2.imshow('BLIP Camera Captioning', display_frame)
+        
+        if saved_rows is not None:
+            display_frame[:45] = saved_rows
     
     def check_for_quit(self) -> bool:
         """Check if user wants to quit (pressed 'q')"""
         if not self.show_window:
             return False
         
-        key = cv2.waitKey(1) & 0xFF
+        # pollKey pumps window events without waiting like waitKey(1)
+        key = cv2.pollKey() & 0xFF
         return key == ord('q')
     
     def release(self):
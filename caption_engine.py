@@ -4,9 +4,16 @@ Caption Engine Module
 Main orchestrator for BLIP camera captioning system.
 """
 
+import asyncio
+import multiprocessing as mp
+import queue
 import time
 import os
+from multiprocessing import shared_memory
 from typing import Optional
+import cv2
+import numpy as np
+import caption_worker
 from blip_model import BLIPModelManager
 from camera_manager import CameraManager
 from dual_screen_display import DualScreenDisplay
@@ -15,17 +22,45 @@ class CaptionEngine:
     """Main engine for BLIP camera captioning"""
     
     def __init__(self, model_name="Salesforce/blip-image-captioning-base", 
-                 camera_index=0, show_camera=False, interval=5, dual_screen=False):
+                 camera_index=0, show_camera=False, interval=5, dual_screen=False,
+                 compile_model=True, quant="none", num_beams=1, max_new_tokens=20):
         self.model_name = model_name
         self.camera_index = camera_index
         self.show_camera = show_camera
         self.interval = interval
         self.dual_screen = dual_screen
         
-        # Initialize managers
-        self.blip_manager = BLIPModelManager(model_name)
+        # Initialize managers - the model itself is loaded in the caption worker process
+        self.model_kwargs = {
+            "model_name": model_name,
+            "compile_model": compile_model,
+            "quant": quant,
+            "num_beams": num_beams,
+            "max_new_tokens": max_new_tokens
+        }
+        self.blip_manager = BLIPModelManager(**self.model_kwargs)
         self.camera_manager = CameraManager(camera_index, show_camera and not dual_screen)
         
+        # Caption worker process (created in initialize)
+        self._worker = None
+        self._shm = None
+        self._shm_frame = None
+        self._frame_ready = None
+        self._worker_stop = None
+        self._result_q = None
+        
+        # Display stage target period (paced by deadline, not a fixed sleep)
+        self._period = 1.0 / 30
+        
+        # Pipeline state shared between the capture, caption and display stages
+        self.last_generated_caption = ""
+        self._captions_in_flight = 0
+        self.pipeline_stats = {
+            "fif": 0,    # frames in flight across the pipeline
+            "e2e": 0.0,  # capture-to-display latency of the last caption (s)
+            "f2f": 0.0   # interval between displayed frames (s)
+        }
+        
         # Initialize dual screen display if requested
         if dual_screen:
             self.display = DualScreenDisplay()
@@ -41,12 +76,14 @@ class CaptionEngine:
         """Initialize the caption engine"""
         print(f"🤖 Using BLIP model: {self.model_name}")
         
-        # Load BLIP model
-        if not self.blip_manager.load_model():
+        # Load BLIP model in the caption worker process
+        if not self._start_caption_worker():
+            self._stop_caption_worker()
             return False
         
         # Initialize camera
         if not self.camera_manager.initialize():
+            self._stop_caption_worker()
             return False
         
         print(f"\n🎯 Starting caption generation every {self.interval} seconds...")
@@ -59,63 +96,73 @@ class CaptionEngine:
         
         return True
     
-    def run(self):
-        """Run the main captioning loop"""
-        last_caption_time = 0
+    def _start_caption_worker(self) -> bool:
+        """Spawn the BLIP worker process and wait for the model to load"""
+        ctx = mp.get_context("spawn")
+        
+        # Frames are handed over through shared memory, captions come back on a queue
+        self._shm = shared_memory.SharedMemory(
+            create=True, 
+            size=int(np.prod(caption_worker.FRAME_SHAPE))
+        )
+        self._shm_frame = np.ndarray(caption_worker.FRAME_SHAPE, dtype=np.uint8, buffer=self._shm.buf)
+        self._frame_ready = ctx.Event()
+        self._worker_stop = ctx.Event()
+        self._result_q = ctx.Queue()
+        
+        self._worker = ctx.Process(
+            target=caption_worker.main,
+            args=(self._shm.name, self._frame_ready, self._worker_stop, self._result_q, self.model_kwargs),
+            daemon=True
+        )
+        self._worker.start()
+        
+        # The worker reports whether the model loaded before accepting frames
+        while True:
+            try:
+                return self._result_q.get(timeout=1.0)
+            except queue.Empty:
+                if not self._worker.is_alive():
+                    print("❌ Caption worker exited while loading the model")
+                    return False
+    
+    def _stop_caption_worker(self):
+        """Stop the BLIP worker process and release shared memory"""
+        if self._worker is not None:
+            self._worker_stop.set()
+            self._worker.join(timeout=5)
+            if self._worker.is_alive():
+                self._worker.terminate()
+            self._worker = None
+        
+        if self._shm is not None:
+            # Drop the buffer view before closing the segment
+            self._shm_frame = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+    
+    async def _request_caption(self, frame) -> str:
+        """Copy a frame into shared memory and poll the worker for its caption"""
+        height, width = caption_worker.FRAME_SHAPE[:2]
+        if frame.shape != caption_worker.FRAME_SHAPE:
+            frame = cv2.resize(frame, (width, height))
         
+        np.copyto(self._shm_frame, frame)
+        self._frame_ready.set()
+        
+        while True:
+            try:
+                return self._result_q.get_nowait()
+            except queue.Empty:
+                if not self._worker.is_alive():
+                    raise RuntimeError("Caption worker stopped unexpectedly")
+                await asyncio.sleep(0.01)
+    
+    def run(self):
+        """Run the captioning pipeline until quit"""
         try:
-            while True:
-                # Capture frame
-                ret, frame = self.camera_manager.read_frame()
-                if not ret:
-                    print("❌ Failed to grab frame")
-                    break
-                
-                # Display frame
-                if self.dual_screen:
-                    # Use dual screen display
-                    current_caption = ""
-                    if hasattr(self, 'last_generated_caption'):
-                        current_caption = self.last_generated_caption
-                    self.display.display_camera_frame(frame, current_caption)
-                    
-                    # Check for quit request
-                    if self.display.check_for_quit():
-                        print("\n🛑 Quit requested via display window")
-                        break
-                else:
-                    # Use single camera window
-                    self.camera_manager.display_frame(frame)
-                    
-                    # Check for quit request
-                    if self.camera_manager.check_for_quit():
-                        print("\n🛑 Quit requested via camera window")
-                        break
-                
-                current_time = time.time()
-                
-                # Generate caption every specified interval
-                if current_time - last_caption_time >= self.interval:
-                    timestamp = time.strftime("%H:%M:%S")
-                    print(f"🔄 [{timestamp}] Processing frame...")
-                    
-                    caption = self.blip_manager.generate_caption(frame)
-                    print(f"📝 [{timestamp}] {caption}\n")
-                    
-                    # Store caption for display
-                    self.last_generated_caption = caption
-                    
-                    # Update display with caption
-                    if self.dual_screen:
-                        self.display.add_caption(caption)
-                    else:
-                        self.camera_manager.display_frame(frame, caption)
-                    
-                    last_caption_time = current_time
-                
-                # Small delay to prevent excessive CPU usage
-                time.sleep(0.03)
-                
+            asyncio.run(self._run_async())
         except KeyboardInterrupt:
             print("\n🛑 Stopped by user")
         except Exception as e:
@@ -123,8 +170,132 @@ class CaptionEngine:
         finally:
             self.cleanup()
     
+    async def _run_async(self):
+        """Run capture, caption and display stages as concurrent tasks"""
+        # Bounded queues between stages (drop-oldest for frames)
+        self.frame_q = asyncio.Queue(maxsize=2)          # capture -> display
+        self.caption_frame_q = asyncio.Queue(maxsize=1)  # capture -> caption (latest frame only)
+        self.caption_q = asyncio.Queue(maxsize=4)        # caption -> display
+        
+        tasks = [
+            asyncio.create_task(self._capture_loop()),
+            asyncio.create_task(self._caption_loop()),
+            asyncio.create_task(self._display_loop())
+        ]
+        
+        try:
+            # Stop the whole pipeline as soon as any stage finishes
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _capture_loop(self):
+        """Capture stage: read camera frames in a worker thread"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            ret, frame = await loop.run_in_executor(None, self.camera_manager.read_latest_frame)
+            if not ret:
+                print("❌ Failed to grab frame")
+                return
+            
+            item = (frame, time.time())
+            self._put_latest(self.frame_q, item)
+            self._put_latest(self.caption_frame_q, item)
+    
+    async def _caption_loop(self):
+        """Caption stage: caption a frame in the worker process every interval"""
+        last_caption_time = 0
+        
+        while True:
+            # Wait for the next caption slot
+            delay = self.interval - (time.time() - last_caption_time)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            
+            frame, captured_at = await self.caption_frame_q.get()
+            last_caption_time = time.time()
+            
+            timestamp = time.strftime("%H:%M:%S")
+            print(f"🔄 [{timestamp}] Processing frame...")
+            
+            self._captions_in_flight += 1
+            try:
+                caption = await self._request_caption(frame)
+            finally:
+                self._captions_in_flight -= 1
+            
+            print(f"📝 [{timestamp}] {caption}\n")
+            await self.caption_q.put((caption, captured_at))
+    
+    async def _display_loop(self):
+        """Display stage: show every captured frame and pick up new captions"""
+        last_frame_time = None
+        
+        while True:
+            loop_start = time.monotonic()
+            frame, captured_at = await self.frame_q.get()
+            
+            # Collect captions finished since the last frame
+            new_caption = ""
+            while not self.caption_q.empty():
+                new_caption, caption_captured_at = self.caption_q.get_nowait()
+                self.last_generated_caption = new_caption
+                self.pipeline_stats["e2e"] = time.time() - caption_captured_at
+                
+                if self.dual_screen:
+                    self.display.add_caption(new_caption)
+            
+            # Display frame
+            if self.dual_screen:
+                # Use dual screen display (text windows only repaint when dirty)
+                self.display.refresh()
+                self.display.display_camera_frame(frame, self.last_generated_caption)
+                
+                # Check for quit request
+                if self.display.check_for_quit():
+                    print("\n🛑 Quit requested via display window")
+                    return
+            else:
+                # Use single camera window
+                self.camera_manager.display_frame(frame, new_caption)
+                
+                # Check for quit request
+                if self.camera_manager.check_for_quit():
+                    print("\n🛑 Quit requested via camera window")
+                    return
+            
+            # Update pipeline counters
+            now = time.time()
+            if last_frame_time is not None:
+                self.pipeline_stats["f2f"] = now - last_frame_time
+            last_frame_time = now
+            self.pipeline_stats["fif"] = (
+                self.frame_q.qsize() + 
+                self.caption_frame_q.qsize() + 
+                self._captions_in_flight
+            )
+            
+            # Pace to the target display rate using the time left in this period
+            slack = self._period - (time.monotonic() - loop_start)
+            if slack > 0.002:
+                await asyncio.sleep(slack)
+    
+    @staticmethod
+    def _put_latest(queue, item):
+        """Put item on a bounded queue, evicting the oldest entry when full"""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(item)
+    
     def cleanup(self):
         """Clean up resources"""
+        self._stop_caption_worker()
+        
         if self.dual_screen:
             self.display.cleanup()
         else:
@@ -139,5 +310,6 @@ class CaptionEngine:
                 "interval": self.interval,
                 "show_camera": self.show_camera,
                 "dual_screen": self.dual_screen
-            }
+            },
+            "pipeline": dict(self.pipeline_stats)
         }
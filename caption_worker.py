@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Caption Worker Module
+Hosts the BLIP model in a separate process and captions frames from shared memory.
+"""
+
+import os
+import signal
+import numpy as np
+from multiprocessing import shared_memory
+
+# Frame layout shared with the caption engine (matches CameraManager resolution)
+FRAME_SHAPE = (480, 640, 3)
+
+def main(shm_name, frame_ready, stop_event, result_queue, model_kwargs, frame_shape=FRAME_SHAPE):
+    """Load BLIP once, then caption each frame signalled through shared memory"""
+    # Ctrl+C is handled by the main process, which stops the worker via stop_event
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    
+    # Lift the thread limit for the model only - the main process stays single-threaded
+    num_threads = max(1, (os.cpu_count() or 2) // 2)
+    os.environ['OMP_NUM_THREADS'] = str(num_threads)
+    os.environ['MKL_NUM_THREADS'] = str(num_threads)
+    
+    import torch
+    from blip_model import BLIPModelManager
+    torch.set_num_threads(num_threads)
+    
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frame = np.ndarray(frame_shape, dtype=np.uint8, buffer=shm.buf)
+    
+    try:
+        blip_manager = BLIPModelManager(**model_kwargs)
+        
+        # First message tells the engine whether the model loaded
+        loaded = blip_manager.load_model()
+        result_queue.put(loaded)
+        if not loaded:
+            return
+        
+        while not stop_event.is_set():
+            if not frame_ready.wait(timeout=0.1):
+                continue
+            frame_ready.clear()
+            
+            result_queue.put(blip_manager.generate_caption(frame))
+    
+    finally:
+        # Release the buffer view before detaching from shared memory
+        del frame
+        shm.close()
@@ -6,10 +6,56 @@ Shows camera feed in one window and cumulative text in another.
 
 import cv2
 import numpy as np
-from typing import List, Optional
+import queue
+import string
+import threading
+from collections import deque
+from typing import Deque, Optional, Tuple
 import time
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 
+# Optional: compiled glyph blit loop (build with: cythonize -i _blit.pyx)
+try:
+    from _blit import blit_column
+except ImportError:
+    blit_column = None
+
+def _blend_white(region: np.ndarray, mask: np.ndarray):
+    """Composite white through a coverage mask in place, rounding exactly as PIL does"""
+    mask = mask.astype(np.uint16)
+    blended = region * (255 - mask)
+    blended += mask * 255
+    blended += 128
+    blended += blended >> 8
+    blended >>= 8
+    region[...] = blended
+
+@lru_cache(maxsize=128)
+def _wrap_cached(text: str, max_chars_per_line: int) -> str:
+    """Word-wrap text to a character limit (pure, so results are memoized)"""
+    words = text.split()
+    lines = []
+    current_line = ""
+    
+    for word in words:
+        if len(current_line + " " + word) <= max_chars_per_line:
+            if current_line:
+                current_line += " " + word
+            else:
+                current_line = word
+        else:
+            if current_line:
+                lines.append(current_line)
+                current_line = word
+            else:
+                lines.append(word)
+    
+    if current_line:
+        lines.append(current_line)
+    
+    return "\n".join(lines)
+
 class DualScreenDisplay:
     """Manages dual screen display with camera and text windows"""
     
@@ -25,6 +71,9 @@ class DualScreenDisplay:
     COLUMN_WIDTH = 25          # 컬럼 간격 (가로 간격)
     CHAR_SPACING = 2           # 글자 간격 (세로 여백)
     MAX_CAPTIONS = 200         # 최대 저장 캡션 수
+    FOOTER_HEIGHT = 40         # 하단 정보 영역 높이
+    CAMERA_FPS = 15            # 카메라 창 최대 갱신 속도
+    TEXT_MIN_INTERVAL = 0.016  # 텍스트 창 최소 갱신 간격 (초)
     
     # ================================
     
@@ -36,13 +85,17 @@ class DualScreenDisplay:
         self.text_windows = ["Text Window 1", "Text Window 2"]  # 여러 텍스트 창
         
         # Text storage - 두 개의 창을 위한 캡션 저장
-        self.window1_captions: List[str] = []  # Text Window 1 캡션들
-        self.window2_captions: List[str] = []  # Text Window 2 캡션들
+        # Each entry is (caption, glyph_ids, ascii_only) - computed once per caption
+        self.window1_captions: Deque[Tuple[str, np.ndarray, bool]] = deque()  # Text Window 1 캡션들
+        self.window2_captions: Deque[Tuple[str, np.ndarray, bool]] = deque()  # Text Window 2 캡션들
         self.max_captions = self.MAX_CAPTIONS
         
         # Window management
         self.window_capacity = 0  # 한 창당 최대 캡션 수
         
+        # Overlay and scroll ops are tiny - cap OpenCV's pool to avoid oversubscription
+        cv2.setNumThreads(2)
+        
         # Font setup
         self.font_path = self.FONT_PATH
         self.font_size = self.FONT_SIZE
@@ -53,9 +106,67 @@ class DualScreenDisplay:
         self.chars_per_column = None  # No limit - use full height
         self.column_width = self.COLUMN_WIDTH
         
+        # Layout metrics never change at runtime - compute them once
+        self._char_height = self.font_size + self.CHAR_SPACING
+        self._max_columns = (self.window_width - 40) // self.COLUMN_WIDTH
+        self._max_chars_per_column = (self.window_height - 40) // self._char_height
+        self._row_ys = 20 + np.arange(self._max_chars_per_column, dtype=np.int64) * self._char_height
+        self._start_x = self.window_width - 20
+        self._space_to_hyphen = str.maketrans(" ", "-")
+        self._footer_text_prefixes = [f"Window {i + 1} | Captions: " for i in range(len(self.text_windows))]
+        
+        # Bound the caption buffers up front so overflow is a single O(1) deque append
+        self._calculate_window_capacity()
+        
+        # Rendered text windows, updated incrementally one column at a time.
+        # Canvases extend past the right edge by the widest glyph reach so the
+        # newest column is never clipped before it scrolls into view. Text is
+        # white on black, so canvases are single-channel - imshow displays them
+        # as grayscale. Like the full redraw, text may run down into the footer
+        # band; the footer is kept as a separate mask and composited on top.
+        self._text_bottom = self.window_height - self.FOOTER_HEIGHT
+        self._column_pad = 2  # room for glyphs with a negative left bearing
+        self._glyph_reach = 2 * self.font_size  # furthest a glyph inks right of its column
+        self._visible_columns = min(self._max_columns, (self._start_x - 20) // self.COLUMN_WIDTH + 1)
+        self._text_canvases = [
+            np.zeros((self.window_height, self._start_x + self._glyph_reach), np.uint8)
+            for _ in self.text_windows
+        ]
+        # Spare canvas per window - each scroll copies into it and the two swap
+        self._back_canvases = [np.zeros_like(canvas) for canvas in self._text_canvases]
+        # Columns currently on screen (newest last), kept to redraw overlaps on eviction
+        self._visible_glyphs = [deque(maxlen=self._visible_columns) for _ in self.text_windows]
+        self._footer_masks = [
+            np.zeros((self.FOOTER_HEIGHT, self.window_width), np.uint8) for _ in self.text_windows
+        ]
+        self._footer_counts = [-1] * len(self.text_windows)
+        
+        # Redraw gating - a text window is shown only after its captions change
+        # (at most once per TEXT_MIN_INTERVAL), the camera window at most
+        # CAMERA_FPS times per second
+        self._last_render_ts = 0.0
+        self._last_cam_show = 0.0
+        self._caption_overlay = None  # (key, strip, mask) of the caption text
+        self._ts_overlay = None  # (key, strip, mask) of the timestamp
+        
         # Create windows
         self._create_windows()
         
+        # Text windows are rendered on a background thread so add_caption never
+        # blocks on drawing. Column pushes queue up in order; the wake-up queue
+        # is bounded, so a burst of captions collapses into one render pass.
+        # The main thread keeps all highgui calls and shows the finished frames.
+        self._pending_pushes = deque()  # (window_index, glyph_ids, ascii_only, count)
+        self._pending_frames = {}  # window_index -> frame waiting for imshow
+        self._frames_lock = threading.Lock()
+        self._render_q = queue.Queue(maxsize=2)
+        self._render_thread = threading.Thread(target=self._render_loop, daemon=True)
+        self._render_thread.start()
+        
+        # Show both (empty) text windows with their footers
+        for window_index in range(len(self.text_windows)):
+            self._schedule_column(window_index, None, True, 0)
+        
     def _create_windows(self):
         """Create multiple windows (camera + text windows)"""
         # Create camera window
@@ -85,193 +196,367 @@ class DualScreenDisplay:
             except:
                 self.font = None
         
+        # OpenCV's FreeType renderer (opencv-contrib) draws straight into BGR arrays
+        self._ft = None
+        if hasattr(cv2, 'freetype'):
+            try:
+                self._ft = cv2.freetype.createFreeType2()
+                self._ft.loadFontData(self.font_path, 0)
+            except cv2.error as e:
+                print(f"⚠️  OpenCV FreeType unavailable, using PIL: {e}")
+                self._ft = None
+        
+        self._build_glyph_cache()
+    
+    def _build_glyph_cache(self):
+        """Rasterize printable ASCII once so columns are drawn with array copies"""
+        # PIL is only used here (and for characters first seen later) - never per frame
+        self._glyph_cache = {}
+        self._measure_draw = ImageDraw.Draw(Image.new('L', (1, 1)))
+        for char in string.printable:
+            if char == " " or not char.isspace():
+                self._get_glyph(ord(char))
+        
+        # Printable ASCII captions index this table directly by code point
+        self._ascii_glyphs = [self._glyph_cache.get(code) for code in range(128)]
+    
+    def _get_glyph(self, glyph_id: int):
+        """Return (x_offset, y_offset, bitmap or None) for a code point, rendering it on first use"""
+        glyph = self._glyph_cache.get(glyph_id)
+        if glyph is None:
+            glyph = self._rasterize_glyph(chr(glyph_id))
+            self._glyph_cache[glyph_id] = glyph
+        return glyph
+    
+    def _rasterize_glyph(self, char: str):
+        """Render one character with PIL into a trimmed single-channel bitmap"""
+        left, top, right, bottom = self._measure_draw.textbbox((0, 0), char, font=self.font)
+        image = Image.new('L', (max(1, right - left), max(1, bottom - top)), 0)
+        ImageDraw.Draw(image).text((-left, -top), char, font=self.font, fill=255)
+        mask = np.asarray(image)
+        
+        # Trim to the inked pixels so blits touch as few bytes as possible;
+        # blank glyphs (spaces) are stored without a bitmap and skipped
+        ys, xs = np.nonzero(mask)
+        if len(ys) == 0:
+            return (left, top, None)
+        y0, y1, x0, x1 = ys.min(), ys.max() + 1, xs.min(), xs.max() + 1
+        
+        # Text is white on black, so one channel is enough
+        bitmap = mask[y0:y1, x0:x1].copy()
+        return (left + int(x0), top + int(y0), bitmap)
+        
     def display_camera_frame(self, frame, current_caption: str = ""):
         """Display camera frame with optional caption overlay"""
-        display_frame = frame.copy()
+        # Limit camera window updates to CAMERA_FPS
+        now = time.time()
+        if now - self._last_cam_show < 1.0 / self.CAMERA_FPS:
+            return
+        self._last_cam_show = now
+        
+        height, width = frame.shape[:2]
+        overlays = []
         
-        # Add current caption overlay if available
+        # Caption overlay is re-drawn only when the caption changes
         if current_caption:
-            # Wrap text for better display
-            wrapped_caption = self._wrap_text(current_caption, 60)
-            y_offset = 30
-            
-            for line in wrapped_caption.split('\n'):
-                cv2.putText(
-                    display_frame,
-                    line,
-                    (10, y_offset),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6,
-                    (0, 255, 0),  # Green color
-                    2
+            caption_key = (current_caption, width)
+            if self._caption_overlay is None or self._caption_overlay[0] != caption_key:
+                # Wrap text for better display
+                lines = self._wrap_text(current_caption, 60).split('\n')
+                strip, mask = self._render_overlay(
+                    lines, 30 + 25 * len(lines), width, 30, 
+                    0.6, (0, 255, 0), 2  # Green color
                 )
-                y_offset += 25
-        
-        # Add timestamp
-        timestamp = time.strftime("%H:%M:%S")
-        cv2.putText(
-            display_frame,
-            f"Live - {timestamp}",
-            (10, display_frame.shape[0] - 20),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.5,
-            (255, 255, 255),  # White color
-            1
-        )
+                self._caption_overlay = (caption_key, strip, mask)
+            overlays.append((0, self._caption_overlay))
+        
+        # Timestamp overlay is re-drawn once per second
+        top = max(0, height - 45)
+        ts_key = (int(now), height, width)
+        if self._ts_overlay is None or self._ts_overlay[0] != ts_key:
+            timestamp = time.strftime("%H:%M:%S")
+            strip, mask = self._render_overlay(
+                [f"Live - {timestamp}"], height - top, width, height - 20 - top, 
+                0.5, (255, 255, 255), 1  # White color
+            )
+            self._ts_overlay = (ts_key, strip, mask)
+        overlays.append((top, self._ts_overlay))
+        
+        # Blit the text pixels straight onto the frame, saving only the rows
+        # they cover and putting them back after imshow
+        saved_rows = []
+        for row, (_, strip, mask) in overlays:
+            band = frame[row:row + strip.shape[0]]
+            rows = band.shape[0]
+            saved_rows.append((band, band.copy()))
+            np.copyto(band, strip[:rows], where=mask[:rows, :, None])
+        
+        cv2.imshow(self.camera_window, frame)
         
-        cv2.imshow(self.camera_window, display_frame)
+        # Restore in reverse so overlapping bands end up with the original pixels
+        for band, saved in reversed(saved_rows):
+            np.copyto(band, saved)
         
+    def _render_overlay(self, lines, height: int, width: int, y_offset: int, 
+                        font_scale: float, color, thickness: int):
+        """Pre-draw text lines on a black strip; returns (strip, mask of text pixels)"""
+        strip = np.zeros((height, width, 3), np.uint8)
+        for line in lines:
+            cv2.putText(
+                strip,
+                line,
+                (10, y_offset),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                font_scale,
+                color,
+                thickness
+            )
+            y_offset += 25
+        return strip, strip.any(axis=2)
+    
     def add_caption(self, caption: str):
         """Add a new caption to Window 1, overflow goes to Window 2"""
-        # Calculate window capacity if not done yet
-        if self.window_capacity == 0:
-            self._calculate_window_capacity()
+        window1 = self.window1_captions
         
-        # Add new caption to Window 1 (right side)
-        self.window1_captions.append(caption)
+        # Replace spaces with hyphens and convert to glyph ids (code points) once;
+        # Window 2 reuses them when the caption overflows
+        caption_text = caption.translate(self._space_to_hyphen)
+        ascii_only = caption_text.isascii() and caption_text.isprintable()
+        if ascii_only:
+            glyph_ids = np.frombuffer(caption_text.encode('ascii'), dtype=np.uint8).astype(np.uint32)
+        else:
+            glyph_ids = np.frombuffer(caption_text.encode('utf-32-le'), dtype=np.uint32)
+        
+        # If Window 1 is full, its oldest caption moves to Window 2
+        # (both deques drop their oldest entry on append once full)
+        if len(window1) == window1.maxlen:
+            overflow_entry = window1[0]
+            self.window2_captions.append(overflow_entry)
+            self._schedule_column(1, overflow_entry[1], overflow_entry[2], len(self.window2_captions))
         
-        # If Window 1 is full, move oldest caption to Window 2
-        if len(self.window1_captions) > self.window_capacity:
-            # Move the oldest caption from Window 1 to Window 2
-            overflow_caption = self.window1_captions.pop(0)
-            self.window2_captions.append(overflow_caption)
+        # Add new caption to Window 1 (right side)
+        window1.append((caption, glyph_ids, ascii_only))
+        self._schedule_column(0, glyph_ids, ascii_only, len(window1))
+    
+    def _schedule_column(self, window_index: int, glyph_ids: Optional[np.ndarray], 
+                         ascii_only: bool, count: int):
+        """Queue a column push (or just a footer update) for the render thread"""
+        self._pending_pushes.append((window_index, glyph_ids, ascii_only, count))
+        try:
+            self._render_q.put_nowait(True)
+        except queue.Full:
+            pass  # a wake-up is already pending and will drain this push too
+    
+    def _render_loop(self):
+        """Apply queued column pushes and publish finished frames (render thread)"""
+        while True:
+            if self._render_q.get() is None:
+                self._render_q.task_done()
+                return
+            
+            rendered = set()
+            while self._pending_pushes:
+                window_index, glyph_ids, ascii_only, count = self._pending_pushes.popleft()
+                rendered.add(window_index)
+                
+                # A failed push must not kill the thread - later captions still render
+                try:
+                    if glyph_ids is not None:
+                        self._push_column(window_index, glyph_ids, ascii_only)
+                    
+                    # Re-render the cached footer strip only when the caption count changes
+                    if self._footer_counts[window_index] != count:
+                        self._draw_footer(count, window_index)
+                        self._footer_counts[window_index] = count
+                except Exception as e:
+                    print(f"⚠️  Could not render text window {window_index + 1}: {e}")
+            
+            # Hand the main thread a snapshot, since the canvases keep changing
+            for window_index in rendered:
+                frame = self._text_canvases[window_index][:, :self.window_width].copy()
+                _blend_white(frame[self._text_bottom:], self._footer_masks[window_index])
+                with self._frames_lock:
+                    self._pending_frames[window_index] = frame
             
-            # If Window 2 is also full, remove oldest caption
-            if len(self.window2_captions) > self.window_capacity:
-                self.window2_captions.pop(0)
+            self._render_q.task_done()
+    
+    def refresh(self):
+        """Show the text windows whose captions changed since the last refresh"""
+        if not self._pending_frames:
+            return
+        
+        # Bursts of captions are coalesced - dirty windows wait for the next tick
+        now = time.time()
+        if now - self._last_render_ts < self.TEXT_MIN_INTERVAL:
+            return
+        self._last_render_ts = now
         
         self._update_text_display()
     
     def _calculate_window_capacity(self):
         """Calculate how many captions can fit in one text window"""
-        column_width = self.COLUMN_WIDTH
-        char_height = self.font_size + self.CHAR_SPACING
-        
-        # Calculate how many columns can fit horizontally
-        max_columns = (self.window_width - 40) // column_width
-        
-        # Calculate how many characters can fit in each column (full height)
-        max_chars_per_column = (self.window_height - 40) // char_height
+        max_columns = self._max_columns
         
         # Estimate capacity based on average caption length
         # Assume average caption is about 30 characters
         avg_caption_length = 30
         self.window_capacity = max_columns * max(1, int(avg_caption_length / 20))  # Rough estimate
         
+        # Rebuild the caption buffers with the new bound, keeping the newest captions
+        self.window1_captions = deque(self.window1_captions, maxlen=self.window_capacity)
+        self.window2_captions = deque(self.window2_captions, maxlen=self.window_capacity)
+        
     def _update_text_display(self):
-        """Update both text windows with vertical Chinese-style layout"""
-        # Update Window 1
-        self._update_single_window(self.window1_captions, 0)
+        """Show the text windows the render thread has finished (main thread)"""
+        with self._frames_lock:
+            frames, self._pending_frames = self._pending_frames, {}
         
-        # Update Window 2  
-        self._update_single_window(self.window2_captions, 1)
+        # Window 2 only has a new frame when Window 1 overflowed into it
+        for window_index, frame in sorted(frames.items()):
+            cv2.imshow(self.text_windows[window_index], frame)
     
-    def _update_single_window(self, captions: List[str], window_index: int):
-        """Update a single text window with vertical Chinese-style layout"""
-        # Create PIL image with black background
-        pil_image = Image.new('RGB', (self.window_width, self.window_height), 'black')
-        draw = ImageDraw.Draw(pil_image)
-        
-        if captions:
-            # Calculate layout - 실시간으로 설정값 사용
-            column_width = self.COLUMN_WIDTH
-            char_height = self.font_size + self.CHAR_SPACING
-            
-            # Calculate how many characters can fit in each column (full height)
-            max_chars_per_column = (self.window_height - 40) // char_height
-            
-            # Use full height if no limit specified
-            if self.chars_per_column is None:
-                chars_per_column = max_chars_per_column
-            else:
-                chars_per_column = min(self.chars_per_column, max_chars_per_column)
-            
-            # Calculate how many columns can fit horizontally
-            max_columns = (self.window_width - 40) // column_width
+    def _push_column(self, window_index: int, glyph_ids: np.ndarray, ascii_only: bool):
+        """Scroll a text window one column left and draw the new caption on the right"""
+        column_width = self.COLUMN_WIDTH
+        start_x = self._start_x
+        pad = self._column_pad
+        
+        front = self._text_canvases[window_index]
+        back = self._back_canvases[window_index]
+        
+        # Shift existing columns left into the spare canvas - an in-place
+        # overlapping copy would make numpy allocate a full-size temporary.
+        # The strip uncovered on the right only holds stale pixels.
+        back[:, :-column_width] = front[:, column_width:]
+        back[:, -column_width:] = 0
+        self._text_canvases[window_index] = back
+        self._back_canvases[window_index] = front
+        
+        visible = self._visible_glyphs[window_index]
+        if len(visible) == visible.maxlen:
+            # The oldest column scrolled past the last visible slot. Clear
+            # everything it could have inked and redraw, newest first, the part
+            # of the remaining columns that falls inside the cleared strip.
+            evicted_x = start_x - len(visible) * column_width
+            edge = max(0, evicted_x + self._glyph_reach)
+            cleared = back[:, :edge]
+            cleared.fill(0)
+            for age in range(1, len(visible)):
+                column_x = start_x - age * column_width
+                if column_x - pad < edge:
+                    old_ids, old_ascii = visible[-age]
+                    self._draw_column(cleared, column_x, old_ids, old_ascii)
+        visible.append((glyph_ids, ascii_only))
+        
+        # Draw the new column at the right edge. The full redraw blends the
+        # newest column first, so the slot is cleared and every column that
+        # reaches into it is redrawn there newest-first to round the same way.
+        slot_x = start_x - pad
+        slot = back[:, slot_x:]
+        slot.fill(0)
+        for age in range(len(visible)):
+            column_x = start_x - age * column_width
+            if column_x + self._glyph_reach <= slot_x:
+                break
+            slot_ids, slot_ascii = visible[-1 - age]
+            self._draw_column(slot, column_x - slot_x, slot_ids, slot_ascii)
+    
+    def _compute_glyph_positions(self, glyph_ids: np.ndarray, column_x: int):
+        """Lay out one column at once: (ys, xs, glyph_ids) of the characters that fit"""
+        # Characters run down the column until they reach the bottom margin
+        max_rows = self._max_chars_per_column
+        count = min(len(glyph_ids), max_rows)
+        return self._row_ys[:count], np.full(count, column_x, dtype=np.int64), glyph_ids[:count]
+    
+    def _draw_column(self, text_area: np.ndarray, column_x: int, glyph_ids: np.ndarray, 
+                     ascii_only: bool):
+        """Blit one caption as a vertical column of cached glyphs"""
+        area_height, area_width = text_area.shape[:2]
+        
+        # Printable ASCII (the common case) indexes the prebuilt table; anything
+        # else goes through the cache and is rasterized on first use
+        get_glyph = self._ascii_glyphs.__getitem__ if ascii_only else self._get_glyph
+        
+        ys, xs, glyph_ids = self._compute_glyph_positions(glyph_ids, column_x)
+        if blit_column is not None:
+            blit_column(text_area, ys, xs, glyph_ids.tolist(), get_glyph)
+            return
+        
+        # Bind the blend once - the loop body runs for every character
+        blend_white = _blend_white
+        
+        for char_y, char_x, glyph_id in zip(ys.tolist(), xs.tolist(), glyph_ids.tolist()):
+            x_offset, y_offset, bitmap = get_glyph(glyph_id)
+            if bitmap is None:
+                continue
             
-            # Keep only the latest captions that can fit on screen
-            visible_captions = captions[-max_columns:] if len(captions) > max_columns else captions
+            # Place the cached glyph, clipped to the text area
+            x0 = char_x + x_offset
+            y0 = char_y + y_offset
+            x1 = min(x0 + bitmap.shape[1], area_width)
+            y1 = min(y0 + bitmap.shape[0], area_height)
+            start_x = max(x0, 0)
+            start_y = max(y0, 0)
+            if x1 <= start_x or y1 <= start_y:
+                continue
             
-            # Start from right side and work left (newest on right)
-            start_x = self.window_width - 20
-            current_column = 0
+            # Blend rather than copy so overlapping glyphs don't erase each other
+            blend_white(
+                text_area[start_y:y1, start_x:x1],
+                bitmap[start_y - y0:y1 - y0, start_x - x0:x1 - x0]
+            )
+        
+    def _draw_footer(self, count: int, window_index: int):
+        """Draw the footer mask with window info, composited over each frame"""
+        footer_area = self._footer_masks[window_index]
+        footer_area.fill(0)
+        
+        footer_text = f"{self._footer_text_prefixes[window_index]}{count} | Press 'q' to quit"
+        
+        if self._ft is not None:
+            # FreeType draws into BGR images - render a scratch strip and keep one channel
+            scratch = np.zeros(footer_area.shape + (3,), np.uint8)
             
-            # Process each caption as a separate column (newest first)
-            for caption in reversed(visible_captions):
-                # Replace spaces with hyphens
-                caption_text = caption.replace(" ", "-")
-                chars = list(caption_text)
-                
-                # Calculate column position (right to left)
-                column_x = start_x - (current_column * column_width)
-                
-                if column_x < 20:  # Stop if we run out of space
-                    break
-                
-                # Draw characters vertically in this column
-                for j, char in enumerate(chars):
-                    char_y = 20 + (j * char_height)
-                    
-                    if char_y + char_height > self.window_height - 20:
-                        break
-                    
-                    # Draw character
-                    draw.text(
-                        (column_x, char_y),
-                        char,
-                        font=self.font,
-                        fill='white'
-                    )
-                
-                # Move to next column for next caption
-                current_column += 1
-        
-        # Add footer with window info
-        window_num = window_index + 1
-        footer_text = f"Window {window_num} | Captions: {len(captions)} | Press 'q' to quit"
-        draw.text(
-            (20, self.window_height - 30),
+            # putText anchors at the baseline; shift down so the text top sits where PIL draws it
+            (_, text_height), _ = self._ft.getTextSize(footer_text, self.font_size, -1)
+            self._ft.putText(
+                scratch, footer_text, (20, self.FOOTER_HEIGHT - 30 + text_height),
+                self.font_size, (255, 255, 255), -1, cv2.LINE_AA, False
+            )
+            footer_area[:] = scratch[:, :, 0]
+            return
+        
+        # Fallback: render a single-channel mask with PIL
+        footer = Image.new('L', (self.window_width, self.FOOTER_HEIGHT), 0)
+        ImageDraw.Draw(footer).text(
+            (20, self.FOOTER_HEIGHT - 30),
             footer_text,
             font=self.font,
-            fill='white'
+            fill=255
         )
-        
-        # Convert PIL image back to OpenCV format
-        text_image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
-        
-        # Show in the specific text window
-        cv2.imshow(self.text_windows[window_index], text_image)
+        footer_area[:] = np.asarray(footer)
         
     def _wrap_text(self, text: str, max_chars_per_line: int) -> str:
         """Wrap text to fit within specified character limit (kept for compatibility)"""
-        words = text.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            if len(current_line + " " + word) <= max_chars_per_line:
-                if current_line:
-                    current_line += " " + word
-                else:
-                    current_line = word
-            else:
-                if current_line:
-                    lines.append(current_line)
-                    current_line = word
-                else:
-                    lines.append(word)
-        
-        if current_line:
-            lines.append(current_line)
-        
-        return "\n".join(lines)
+        return _wrap_cached(text, max_chars_per_line)
         
     def check_for_quit(self) -> bool:
         """Check if user wants to quit (pressed 'q' in either window)"""
-        key = cv2.waitKey(1) & 0xFF
+        # pollKey pumps window events without waiting like waitKey(1)
+        key = cv2.pollKey() & 0xFF
         return key == ord('q')
         
     def cleanup(self):
         """Clean up windows and resources"""
+        # Drop pending wake-ups so the stop signal never blocks on a full queue
+        # (e.g. if the render thread is already gone)
+        while True:
+            try:
+                self._render_q.get_nowait()
+            except queue.Empty:
+                break
+            self._render_q.task_done()
+        self._render_q.put_nowait(None)
+        self._render_thread.join(timeout=1.0)
         cv2.destroyAllWindows()
         print("🖥️  All display windows closed")
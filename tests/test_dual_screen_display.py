@@ -0,0 +1,108 @@
+"""
+Dual Screen Display Tests
+The incremental text canvas must match a full PIL redraw pixel for pixel.
+"""
+
+import random
+import string
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import dual_screen_display
+from dual_screen_display import DualScreenDisplay
+
+FONT_PATH = str(Path(__file__).resolve().parent.parent / "assets" / "fonts" / "Acumin Variable Concept.ttf")
+
+
+def _full_redraw(display, captions, window_index):
+    """Render a text window from scratch, the way the display drew it before incremental updates"""
+    image = Image.new('L', (display.window_width, display.window_height), 0)
+    draw = ImageDraw.Draw(image)
+
+    column_width = display.COLUMN_WIDTH
+    char_height = display.font_size + display.CHAR_SPACING
+    max_columns = (display.window_width - 40) // column_width
+
+    # Newest caption on the right, drawn first
+    for current_column, caption in enumerate(reversed(captions[-max_columns:])):
+        column_x = display.window_width - 20 - current_column * column_width
+        if column_x < 20:
+            break
+
+        for j, char in enumerate(caption.replace(" ", "-")):
+            char_y = 20 + j * char_height
+            if char_y + char_height > display.window_height - 20:
+                break
+            draw.text((column_x, char_y), char, font=display.font, fill=255)
+
+    footer_text = f"Window {window_index + 1} | Captions: {len(captions)} | Press 'q' to quit"
+    draw.text((20, display.window_height - 30), footer_text, font=display.font, fill=255)
+    return np.asarray(image)
+
+
+@pytest.fixture
+def shown(monkeypatch):
+    """Stub out highgui and collect the frames passed to imshow"""
+    frames = {}
+    monkeypatch.setattr(cv2, "imshow", lambda name, image: frames.__setitem__(name, image.copy()))
+    for name in ("namedWindow", "resizeWindow", "moveWindow", "destroyAllWindows"):
+        monkeypatch.setattr(cv2, name, lambda *args: None)
+
+    # The FreeType footer is not meant to match PIL - compare the PIL fallback
+    monkeypatch.delattr(cv2, "freetype", raising=False)
+    monkeypatch.setattr(DualScreenDisplay, "FONT_PATH", FONT_PATH)
+    return frames
+
+
+@pytest.mark.parametrize("use_blit_extension", [False, True])
+@pytest.mark.parametrize("window_size, font_size, column_width, caption_count", [
+    ((2560, 1440), 24, 25, 230),  # default settings
+    ((640, 480), 40, 12, 120),  # glyphs overlap neighbouring columns
+])
+def test_incremental_canvas_matches_full_redraw(shown, monkeypatch, use_blit_extension,
+                                                window_size, font_size, column_width, caption_count):
+    if use_blit_extension:
+        if dual_screen_display.blit_column is None:
+            pytest.skip("_blit extension not built")
+    else:
+        monkeypatch.setattr(dual_screen_display, "blit_column", None)
+    monkeypatch.setattr(DualScreenDisplay, "FONT_SIZE", font_size)
+    monkeypatch.setattr(DualScreenDisplay, "COLUMN_WIDTH", column_width)
+
+    rng = random.Random(0)
+    chars = string.ascii_letters + string.digits + ".,'"
+    captions = [
+        " ".join(
+            "".join(rng.choice(chars) for _ in range(rng.randint(1, 9)))
+            for _ in range(rng.randint(1, 12))
+        )
+        for _ in range(caption_count)
+    ]
+    captions[5] = "한국어 캡션 테스트"
+    captions[-3] = "café naïve"
+
+    display = DualScreenDisplay(*window_size)
+    try:
+        checkpoints = {1, caption_count // 3, caption_count - 1}
+        for i, caption in enumerate(captions):
+            display.add_caption(caption)
+            if i not in checkpoints:
+                continue
+
+            display._render_q.join()
+            display._update_text_display()
+            window_captions = (display.window1_captions, display.window2_captions)
+            for window_index, window_name in enumerate(display.text_windows):
+                expected = _full_redraw(
+                    display, [entry[0] for entry in window_captions[window_index]], window_index
+                )
+                np.testing.assert_array_equal(shown[window_name], expected)
+    finally:
+        display.cleanup()